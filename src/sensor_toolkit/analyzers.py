@@ -1,13 +1,17 @@
 """Analysis functions for sensor data."""
 
 import math
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
+from operator import itemgetter
 
 from sensor_toolkit.validators import SensorReading
 
+_FIELDS = ("temperature", "pressure", "humidity")
 
-@dataclass
+
+@dataclass(slots=True)
 class FieldStats:
     """Statistics for a single measurement field.
 
@@ -26,7 +30,7 @@ class FieldStats:
     max: float
 
 
-@dataclass
+@dataclass(slots=True)
 class StatsResult:
     """Statistics result for a single sensor.
 
@@ -45,7 +49,7 @@ class StatsResult:
     humidity: FieldStats
 
 
-@dataclass
+@dataclass(slots=True)
 class Anomaly:
     """Detected anomaly in sensor data.
 
@@ -62,6 +66,14 @@ class Anomaly:
     z_score: float
 
 
+def _median_of_sorted(sorted_vals: list[float]) -> float:
+    """Return the median of a non-empty, already sorted list."""
+    mid = len(sorted_vals) // 2
+    if len(sorted_vals) % 2 == 0:
+        return (sorted_vals[mid - 1] + sorted_vals[mid]) / 2
+    return sorted_vals[mid]
+
+
 def _compute_stats(values: list[float]) -> FieldStats:
     """Compute statistics for a list of values."""
     if not values:
@@ -69,16 +81,58 @@ def _compute_stats(values: list[float]) -> FieldStats:
         return FieldStats(mean=nan, median=nan, std=nan, min=nan, max=nan)
 
     n = len(values)
-    mean = sum(values) / n
+    # One sort serves median, min and max; sum() and sorted() both run in C.
     sorted_vals = sorted(values)
-    if n % 2 == 0:
-        median = (sorted_vals[n // 2 - 1] + sorted_vals[n // 2]) / 2
-    else:
-        median = sorted_vals[n // 2]
-    variance = sum((x - mean) ** 2 for x in values) / n
+    mean = sum(sorted_vals) / n
+    median = _median_of_sorted(sorted_vals)
+    variance = sum((x - mean) * (x - mean) for x in sorted_vals) / n
     std = math.sqrt(variance)
 
-    return FieldStats(mean=mean, median=median, std=std, min=min(values), max=max(values))
+    return FieldStats(mean=mean, median=median, std=std, min=sorted_vals[0], max=sorted_vals[-1])
+
+
+def _field_moments(
+    sensor_stats: list[StatsResult | None],
+    field: str,
+) -> tuple[list[float], list[float]]:
+    """Return one field's per-sensor means and stds, indexed by sensor code.
+
+    Sensors without statistics, or with a zero or NaN spread, get a NaN mean
+    so that every z-score computed against them is NaN and never flagged.
+    """
+    nan = float("nan")
+    means: list[float] = []
+    stds: list[float] = []
+    for s in sensor_stats:
+        fstats: FieldStats | None = getattr(s, field) if s is not None else None
+        if fstats is not None and fstats.std > 0:
+            means.append(fstats.mean)
+            stds.append(fstats.std)
+        else:
+            means.append(nan)
+            stds.append(1.0)
+    return means, stds
+
+
+def _flag_outliers(
+    values: list[float],
+    codes: list[int],
+    means: list[float],
+    stds: list[float],
+    z_threshold: float,
+) -> list[tuple[int, float]]:
+    """Return (row, z_score) for each value whose z-score exceeds the threshold.
+
+    Each row is compared against the mean and std of its own sensor, looked
+    up by sensor code. NaN values and NaN means never compare greater than
+    the threshold, so gap placeholders and skipped sensors need no check.
+    """
+    # Only hits allocate a tuple; no per-value z-score list is materialized.
+    return [
+        (i, z)
+        for i, (v, code) in enumerate(zip(values, codes, strict=True))
+        if (z := abs(v - means[code]) / stds[code]) > z_threshold
+    ]
 
 
 def calculate_statistics(readings: list[SensorReading]) -> dict[str, StatsResult]:
@@ -90,68 +144,278 @@ def calculate_statistics(readings: list[SensorReading]) -> dict[str, StatsResult
     Returns:
         Dictionary mapping sensor_id to StatsResult.
     """
-    by_sensor: dict[str, dict[str, list[float]]] = {}
-
+    # One pass over the readings; each float is appended as the same object
+    # it already is, with no intermediate column to copy into and back out of.
+    by_sensor: dict[str, tuple[list[float], list[float], list[float]]] = {}
     for r in readings:
-        if r.sensor_id not in by_sensor:
-            by_sensor[r.sensor_id] = {"temperature": [], "pressure": [], "humidity": []}
-        sensor_data = by_sensor[r.sensor_id]
-        if not math.isnan(r.temperature):
-            sensor_data["temperature"].append(r.temperature)
-        if not math.isnan(r.pressure):
-            sensor_data["pressure"].append(r.pressure)
-        if not math.isnan(r.humidity):
-            sensor_data["humidity"].append(r.humidity)
+        sensor_data = by_sensor.get(r.sensor_id)
+        if sensor_data is None:
+            sensor_data = by_sensor[r.sensor_id] = ([], [], [])
+        t, p, h = r.temperature, r.pressure, r.humidity
+        # NaN is the only float that compares unequal to itself, so ``v == v``
+        # drops gap placeholders without a math.isnan call per value.
+        if t == t:
+            sensor_data[0].append(t)
+        if p == p:
+            sensor_data[1].append(p)
+        if h == h:
+            sensor_data[2].append(h)
 
     results: dict[str, StatsResult] = {}
-    for sensor_id, sensor_data in by_sensor.items():
-        count = max(len(v) for v in sensor_data.values())
+    for sensor_id, (temperature, pressure, humidity) in by_sensor.items():
         results[sensor_id] = StatsResult(
             sensor_id=sensor_id,
-            reading_count=count,
-            temperature=_compute_stats(sensor_data["temperature"]),
-            pressure=_compute_stats(sensor_data["pressure"]),
-            humidity=_compute_stats(sensor_data["humidity"]),
+            reading_count=max(len(temperature), len(pressure), len(humidity)),
+            temperature=_compute_stats(temperature),
+            pressure=_compute_stats(pressure),
+            humidity=_compute_stats(humidity),
         )
 
     return results
 
 
+class _P2Median:
+    """Running median estimate in O(1) memory (P² algorithm, Jain & Chlamtac 1985).
+
+    Five markers track the minimum, the 25th/50th/75th percentiles and the
+    maximum; marker heights are nudged with piecewise-parabolic interpolation
+    as values arrive. Until five values are seen the median is exact.
+    """
+
+    _INCREMENTS = (0.0, 0.25, 0.5, 0.75, 1.0)
+
+    def __init__(self) -> None:
+        """Create an estimator with no observations."""
+        self._heights: list[float] = []
+        self._positions = [0, 1, 2, 3, 4]
+        self._desired = [0.0, 1.0, 2.0, 3.0, 4.0]
+
+    def add(self, x: float) -> None:
+        """Add one observation to the estimate."""
+        q = self._heights
+        if len(q) < 5:
+            q.append(x)
+            q.sort()
+            return
+
+        if x < q[0]:
+            q[0] = x
+        elif x > q[4]:
+            q[4] = x
+        k = 0 if x < q[1] else 1 if x < q[2] else 2 if x < q[3] else 3
+        for i in range(k + 1, 5):
+            self._positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._INCREMENTS[i]
+        for i in (1, 2, 3):
+            self._adjust(i)
+
+    def _adjust(self, i: int) -> None:
+        """Move marker i one position toward its desired position if it lags."""
+        q, n = self._heights, self._positions
+        d = self._desired[i] - n[i]
+        if not ((d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1)):
+            return
+        step = 1 if d > 0 else -1
+        parabolic = q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+        if q[i - 1] < parabolic < q[i + 1]:
+            q[i] = parabolic
+        else:
+            q[i] += step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+        n[i] += step
+
+    def value(self) -> float:
+        """Return the current median estimate, or NaN if nothing was added."""
+        if not self._heights:
+            return float("nan")
+        return _median_of_sorted(self._heights)
+
+
+class _FieldAccumulator:
+    """Single-pass statistics for one measurement field.
+
+    Mean and variance use Welford's recurrence, so values never need to be
+    kept. With ``approximate=False`` the values are retained instead and the
+    exact statistics are computed by _compute_stats on finalize.
+    """
+
+    def __init__(self, approximate: bool) -> None:
+        """Create an empty accumulator."""
+        self.count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+        self._median = _P2Median() if approximate else None
+        self._values: list[float] | None = None if approximate else []
+
+    def add(self, x: float) -> None:
+        """Add one value; NaN placeholders are ignored."""
+        if x != x:
+            return
+        self.count += 1
+        if self._values is not None:
+            self._values.append(x)
+            return
+        delta = x - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (x - self._mean)
+        self._min = min(self._min, x)
+        self._max = max(self._max, x)
+        self._median.add(x)
+
+    def result(self) -> FieldStats:
+        """Return the statistics of all values added so far."""
+        if self._values is not None or self.count == 0:
+            return _compute_stats(self._values or [])
+        return FieldStats(
+            mean=self._mean,
+            median=self._median.value(),
+            std=math.sqrt(self._m2 / self.count),
+            min=self._min,
+            max=self._max,
+        )
+
+
+class StreamingStats:
+    """Per-sensor statistics accumulated one reading at a time.
+
+    Memory use is constant per sensor, so readings can be consumed from a
+    generator or file without materializing them. The median is estimated
+    with the P² algorithm unless ``approximate=False``, in which case values
+    are retained and every statistic matches calculate_statistics exactly.
+
+    Examples:
+        >>> acc = StreamingStats("TI-A1B2-C3D4")
+        >>> acc.update(20.0, 500.0, 40.0)
+        >>> acc.update(30.0, 510.0, 60.0)
+        >>> acc.finalize().temperature.mean
+        25.0
+    """
+
+    def __init__(self, sensor_id: str, approximate: bool = True) -> None:
+        """Create an accumulator for one sensor.
+
+        Args:
+            sensor_id: The sensor identifier reported in the result.
+            approximate: Estimate the median in O(1) memory (default True).
+        """
+        self.sensor_id = sensor_id
+        self._fields = [_FieldAccumulator(approximate) for _ in _FIELDS]
+
+    def update(self, temperature: float, pressure: float, humidity: float) -> None:
+        """Add one reading's measurements; NaN values are skipped per field."""
+        temp_acc, pressure_acc, humidity_acc = self._fields
+        temp_acc.add(temperature)
+        pressure_acc.add(pressure)
+        humidity_acc.add(humidity)
+
+    def finalize(self) -> StatsResult:
+        """Return the statistics accumulated so far as a StatsResult."""
+        temp_acc, pressure_acc, humidity_acc = self._fields
+        return StatsResult(
+            sensor_id=self.sensor_id,
+            reading_count=max(acc.count for acc in self._fields),
+            temperature=temp_acc.result(),
+            pressure=pressure_acc.result(),
+            humidity=humidity_acc.result(),
+        )
+
+
+def stream_statistics(
+    readings: Iterable[SensorReading],
+    *,
+    approximate: bool = True,
+) -> dict[str, StatsResult]:
+    """Calculate per-sensor statistics in a single pass over any iterable.
+
+    Streaming counterpart of calculate_statistics: readings are consumed once
+    and not stored, so memory grows with the number of sensors rather than
+    the number of readings.
+
+    Args:
+        readings: SensorReading instances, e.g. a generator over a large file.
+        approximate: Estimate medians with the P² algorithm (default True).
+            Pass False for exact medians at the cost of retaining values.
+
+    Returns:
+        Dictionary mapping sensor_id to StatsResult.
+    """
+    accumulators: dict[str, StreamingStats] = {}
+    for r in readings:
+        acc = accumulators.get(r.sensor_id)
+        if acc is None:
+            acc = accumulators[r.sensor_id] = StreamingStats(r.sensor_id, approximate)
+        acc.update(r.temperature, r.pressure, r.humidity)
+
+    return {sensor_id: acc.finalize() for sensor_id, acc in accumulators.items()}
+
+
 def detect_anomalies(
     readings: list[SensorReading],
     z_threshold: float = 2.0,
+    *,
+    stats: dict[str, StatsResult] | None = None,
 ) -> list[Anomaly]:
     """Detect anomalies using z-score threshold.
 
     Args:
         readings: List of SensorReading instances to analyze.
         z_threshold: Z-score threshold (default 2.0).
+        stats: Result of calculate_statistics for the same readings. Pass it
+            to reuse statistics already computed; computed here when None.
 
     Returns:
         List of Anomaly instances.
     """
-    stats = calculate_statistics(readings)
-    anomalies: list[Anomaly] = []
-
-    for reading in readings:
-        if reading.sensor_id not in stats:
-            continue
-        s = stats[reading.sensor_id]
-
-        checks = [
-            ("temperature", reading.temperature, s.temperature),
-            ("pressure", reading.pressure, s.pressure),
-            ("humidity", reading.humidity, s.humidity),
-        ]
-
-        for field, value, fstats in checks:
-            if math.isnan(value) or fstats.std == 0:
-                continue
-            z = abs(value - fstats.mean) / fstats.std
-            if z > z_threshold:
-                anomalies.append(Anomaly(reading=reading, field=field, value=value, z_score=z))
-
-    return anomalies
+    if stats is None:
+        stats = calculate_statistics(readings)
+    # Per-sensor statistics indexed by a small integer code per sensor, so the
+    # scan below is one pass per column with list indexing instead of per-row
+    # dict lookups. Only the code and measurement columns are built.
+    codes: dict[str, int] = {}
+    sensor_codes = [codes.setdefault(r.sensor_id, len(codes)) for r in readings]
+    sensor_stats = [stats.get(sensor_id) for sensor_id in codes]
+    columns = (
+        [r.temperature for r in readings],
+        [r.pressure for r in readings],
+        [r.humidity for r in readings],
+    )
+
+    # (row, field position, field, z_score) for every flagged value
+    hits: list[tuple[int, int, str, float]] = []
+    for position, (field, column) in enumerate(zip(_FIELDS, columns, strict=True)):
+        means, stds = _field_moments(sensor_stats, field)
+        for row, z in _flag_outliers(column, sensor_codes, means, stds, z_threshold):
+            hits.append((row, position, field, z))
+
+    # Restore reading order, then temperature/pressure/humidity within a reading.
+    hits.sort(key=itemgetter(0, 1))
+    # The value comes from the reading itself, not the float column copy, so
+    # the caller's object (e.g. an int) is reported unchanged.
+    return [
+        Anomaly(reading=readings[row], field=field, value=getattr(readings[row], field), z_score=z)
+        for row, _, field, z in hits
+    ]
+
+
+def _round_or_none(v: float) -> float | None:
+    """Round to 2 decimals for the report, mapping NaN to None (JSON null)."""
+    return round(v, 2) if v == v else None
+
+
+def _field_stats_to_dict(fs: FieldStats) -> dict[str, float | None]:
+    """Convert FieldStats into the JSON-ready dict used in reports."""
+    return {
+        "mean": _round_or_none(fs.mean),
+        "median": _round_or_none(fs.median),
+        "std": _round_or_none(fs.std),
+        "min": _round_or_none(fs.min),
+        "max": _round_or_none(fs.max),
+    }
 
 
 def generate_report(readings: list[SensorReading], z_threshold: float = 2.0) -> dict[str, object]:
@@ -165,25 +429,13 @@ def generate_report(readings: list[SensorReading], z_threshold: float = 2.0) ->
         Dictionary with summary, sensors stats, and anomalies.
     """
     stats = calculate_statistics(readings)
-    anomalies = detect_anomalies(readings, z_threshold)
+    anomalies = detect_anomalies(readings, z_threshold, stats=stats)
 
     time_range = None
     if readings:
         timestamps = [r.timestamp for r in readings]
         time_range = {"start": min(timestamps).isoformat(), "end": max(timestamps).isoformat()}
 
-    def to_dict(fs: FieldStats) -> dict[str, float | None]:
-        def rnd(v: float) -> float | None:
-            return round(v, 2) if not math.isnan(v) else None
-
-        return {
-            "mean": rnd(fs.mean),
-            "median": rnd(fs.median),
-            "std": rnd(fs.std),
-            "min": rnd(fs.min),
-            "max": rnd(fs.max),
-        }
-
     return {
         "generated_at": datetime.now().isoformat(),
         "summary": {
@@ -194,9 +446,9 @@ def generate_report(readings: list[SensorReading], z_threshold: float = 2.0) ->
         "sensors": {
             sid: {
                 "reading_count": s.reading_count,
-                "temperature": to_dict(s.temperature),
-                "pressure": to_dict(s.pressure),
-                "humidity": to_dict(s.humidity),
+                "temperature": _field_stats_to_dict(s.temperature),
+                "pressure": _field_stats_to_dict(s.pressure),
+                "humidity": _field_stats_to_dict(s.humidity),
             }
             for sid, s in stats.items()
         },
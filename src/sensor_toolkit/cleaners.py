@@ -1,9 +1,17 @@
 """Data cleaning functions for sensor readings."""
 
+from array import array
+from collections import defaultdict
 from datetime import datetime, timedelta
+from itertools import pairwise
+from operator import attrgetter
 
+from sensor_toolkit.frame import SensorFrame
 from sensor_toolkit.validators import SensorReading
 
+# Shared by every gap placeholder; float objects are immutable.
+_NAN = float("nan")
+
 
 def remove_duplicates(readings: list[SensorReading]) -> list[SensorReading]:
     """Remove duplicate readings based on timestamp and sensor_id.
@@ -28,16 +36,13 @@ def remove_duplicates(readings: list[SensorReading]) -> list[SensorReading]:
         >>> len(result)
         1
     """
-    seen: set[tuple[datetime, str]] = set()
-    result: list[SensorReading] = []
-
+    # setdefault probes the table once per reading and keeps the first value;
+    # dicts preserve insertion order, so first-seen order is kept as well.
+    first_seen: dict[tuple[datetime, str], SensorReading] = {}
     for reading in readings:
-        key = (reading.timestamp, reading.sensor_id)
-        if key not in seen:
-            seen.add(key)
-            result.append(reading)
+        first_seen.setdefault((reading.timestamp, reading.sensor_id), reading)
 
-    return result
+    return list(first_seen.values())
 
 
 def clamp_outliers(
@@ -73,19 +78,90 @@ def clamp_outliers(
         >>> result[0].humidity
         100.0
     """
-    result: list[SensorReading] = []
+    # Unpack the bounds once rather than indexing the tuples for every reading.
+    temp_min, temp_max = temp_range
+    pressure_min, pressure_max = pressure_range
+    humidity_min, humidity_max = humidity_range
+
+    # Positional construction skips keyword matching, and plain comparisons
+    # avoid the max()/min() calls per value. NaN placeholders fail both
+    # comparisons and pass through unchanged.
+    clamped: list[SensorReading] = []
+    for r in readings:
+        t, p, h = r.temperature, r.pressure, r.humidity
+        if t < temp_min:
+            t = temp_min
+        elif t > temp_max:
+            t = temp_max
+        if p < pressure_min:
+            p = pressure_min
+        elif p > pressure_max:
+            p = pressure_max
+        if h < humidity_min:
+            h = humidity_min
+        elif h > humidity_max:
+            h = humidity_max
+        clamped.append(SensorReading(r.timestamp, r.sensor_id, t, p, h))
+
+    return clamped
+
+
+def _clamp_column(column: array, low: float, high: float) -> array:
+    """Return a copy of a float column clamped to [low, high], keeping NaN."""
+    return array("d", [low if v < low else high if v > high else v for v in column])
+
+
+def clamp_frame(
+    frame: SensorFrame,
+    temp_range: tuple[float, float] = (-40.0, 150.0),
+    pressure_range: tuple[float, float] = (0.0, 1000.0),
+    humidity_range: tuple[float, float] = (0.0, 100.0),
+) -> SensorFrame:
+    """Clamp the measurement columns of a SensorFrame to valid ranges.
 
-    for reading in readings:
-        clamped = SensorReading(
-            timestamp=reading.timestamp,
-            sensor_id=reading.sensor_id,
-            temperature=max(temp_range[0], min(temp_range[1], reading.temperature)),
-            pressure=max(pressure_range[0], min(pressure_range[1], reading.pressure)),
-            humidity=max(humidity_range[0], min(humidity_range[1], reading.humidity)),
-        )
-        result.append(clamped)
+    Columnar counterpart of clamp_outliers: each measurement column is
+    clamped in one pass over its packed buffer and no per-reading objects
+    are created. NaN placeholders are left as NaN. The input frame is not
+    modified.
 
-    return result
+    Args:
+        frame: SensorFrame to process.
+        temp_range: Valid temperature range (min, max) in Celsius.
+        pressure_range: Valid pressure range (min, max) in hPa.
+        humidity_range: Valid humidity range (min, max) as percentage.
+
+    Returns:
+        A new SensorFrame with clamped measurement columns.
+    """
+    return SensorFrame(
+        timestamps=frame.timestamps.copy(),
+        sensor_codes=array("i", frame.sensor_codes),
+        sensor_names=frame.sensor_names.copy(),
+        temperature=_clamp_column(frame.temperature, *temp_range),
+        pressure=_clamp_column(frame.pressure, *pressure_range),
+        humidity=_clamp_column(frame.humidity, *humidity_range),
+    )
+
+
+def _fill_sensor_gaps(
+    sensor_id: str,
+    sensor_readings: list[SensorReading],
+    interval: timedelta,
+) -> list[SensorReading]:
+    """Return one sensor's time-sorted readings with NaN placeholders in the gaps."""
+    filled: list[SensorReading] = []
+    for current, following in pairwise(sensor_readings):
+        filled.append(current)
+        # Slots strictly before the next reading: ceil(gap / interval) - 1.
+        # timedelta arithmetic is exact, so no per-slot comparison is needed.
+        missing = -((current.timestamp - following.timestamp) // interval) - 1
+        start = current.timestamp
+        filled.extend(
+            SensorReading(start + k * interval, sensor_id, _NAN, _NAN, _NAN)
+            for k in range(1, missing + 1)
+        )
+    filled.append(sensor_readings[-1])
+    return filled
 
 
 def fill_missing_timestamps(
@@ -120,43 +196,23 @@ def fill_missing_timestamps(
         return []
 
     # Group readings by sensor_id
-    by_sensor: dict[str, list[SensorReading]] = {}
+    by_sensor: defaultdict[str, list[SensorReading]] = defaultdict(list)
     for reading in readings:
-        if reading.sensor_id not in by_sensor:
-            by_sensor[reading.sensor_id] = []
         by_sensor[reading.sensor_id].append(reading)
 
-    # Sort each sensor's readings by timestamp
-    for sensor_id in by_sensor:
-        by_sensor[sensor_id].sort(key=lambda r: r.timestamp)
+    # Sort each sensor's readings by timestamp; attrgetter fetches the key in
+    # C instead of calling a Python lambda per reading.
+    by_timestamp = attrgetter("timestamp")
+    for sensor_readings in by_sensor.values():
+        sensor_readings.sort(key=by_timestamp)
 
     result: list[SensorReading] = []
     interval = timedelta(seconds=interval_seconds)
-
     for sensor_id, sensor_readings in by_sensor.items():
-        for i, reading in enumerate(sensor_readings):
-            result.append(reading)
-
-            # Check if there's a next reading and a gap
-            if i < len(sensor_readings) - 1:
-                next_reading = sensor_readings[i + 1]
-                current_ts = reading.timestamp
-                next_ts = next_reading.timestamp
-
-                # Fill gaps with placeholder readings
-                expected_ts = current_ts + interval
-                while expected_ts < next_ts:
-                    placeholder = SensorReading(
-                        timestamp=expected_ts,
-                        sensor_id=sensor_id,
-                        temperature=float("nan"),
-                        pressure=float("nan"),
-                        humidity=float("nan"),
-                    )
-                    result.append(placeholder)
-                    expected_ts += interval
-
-    # Sort final result by timestamp, then by sensor_id
-    result.sort(key=lambda r: (r.timestamp, r.sensor_id))
+        result.extend(_fill_sensor_gaps(sensor_id, sensor_readings, interval))
+
+    # Each sensor contributes an already sorted run, which timsort merges
+    # in near-linear time; attrgetter builds the (timestamp, sensor_id) keys in C.
+    result.sort(key=attrgetter("timestamp", "sensor_id"))
 
     return result
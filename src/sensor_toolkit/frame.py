@@ -0,0 +1,101 @@
+"""Columnar storage for batches of sensor readings."""
+
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from sensor_toolkit.validators import SensorReading
+
+
+def _float_column() -> array:
+    """Return an empty packed column of C doubles."""
+    return array("d")
+
+
+def _code_column() -> array:
+    """Return an empty packed column of C ints."""
+    return array("i")
+
+
+@dataclass
+class SensorFrame:
+    """A batch of sensor readings stored column-wise (structure of arrays).
+
+    Each SensorReading field lives in its own column, so a scan over one
+    measurement touches a single packed buffer of doubles instead of one
+    Python object per reading. Row ``i`` of every column belongs to the same
+    reading. Sensor identifiers are stored as small integer codes into
+    ``sensor_names``, so each distinct identifier is stored only once.
+
+    Attributes:
+        timestamps: Reading timestamps.
+        sensor_codes: Per-row index into sensor_names.
+        sensor_names: Distinct sensor identifiers, in first-seen order.
+        temperature: Temperature readings in Celsius.
+        pressure: Pressure readings in hPa.
+        humidity: Relative humidity percentages.
+    """
+
+    timestamps: list[datetime] = field(default_factory=list)
+    sensor_codes: array = field(default_factory=_code_column)
+    sensor_names: list[str] = field(default_factory=list)
+    temperature: array = field(default_factory=_float_column)
+    pressure: array = field(default_factory=_float_column)
+    humidity: array = field(default_factory=_float_column)
+
+    def __len__(self) -> int:
+        """Return the number of readings in the frame."""
+        return len(self.sensor_codes)
+
+    @property
+    def sensor_ids(self) -> list[str]:
+        """Per-row sensor identifiers, decoded from sensor_codes."""
+        names = self.sensor_names
+        return [names[code] for code in self.sensor_codes]
+
+    @classmethod
+    def from_readings(cls, readings: list[SensorReading]) -> "SensorFrame":
+        """Build a frame from a list of SensorReading instances.
+
+        Args:
+            readings: Readings to store, in row order.
+
+        Returns:
+            A new SensorFrame holding the same data.
+
+        Examples:
+            >>> from datetime import datetime
+            >>> frame = SensorFrame.from_readings(
+            ...     [SensorReading(datetime(2024, 1, 1), "TI-A1B2-C3D4", 25.0, 500.0, 50.0)]
+            ... )
+            >>> len(frame), frame.temperature[0]
+            (1, 25.0)
+        """
+        codes: dict[str, int] = {}
+        sensor_codes = array("i", [codes.setdefault(r.sensor_id, len(codes)) for r in readings])
+        return cls(
+            timestamps=[r.timestamp for r in readings],
+            sensor_codes=sensor_codes,
+            sensor_names=list(codes),
+            temperature=array("d", [r.temperature for r in readings]),
+            pressure=array("d", [r.pressure for r in readings]),
+            humidity=array("d", [r.humidity for r in readings]),
+        )
+
+    def to_readings(self) -> list[SensorReading]:
+        """Convert the frame back into a list of SensorReading instances.
+
+        Returns:
+            One SensorReading per row, in row order.
+        """
+        return [
+            SensorReading(ts, sid, t, p, h)
+            for ts, sid, t, p, h in zip(
+                self.timestamps,
+                self.sensor_ids,
+                self.temperature,
+                self.pressure,
+                self.humidity,
+                strict=True,
+            )
+        ]
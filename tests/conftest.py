@@ -1,5 +1,6 @@
 """Shared pytest fixtures for sensor toolkit tests."""
 
+from collections.abc import Callable
 from datetime import datetime
 
 import pytest
@@ -47,3 +48,25 @@ def invalid_sensor_id_reading() -> SensorReading:
 def sample_timestamp() -> datetime:
     """Return a sample timestamp for creating test readings."""
     return datetime(2024, 1, 15, 10, 30, 0)
+
+
+@pytest.fixture
+def make_reading() -> Callable[..., SensorReading]:
+    """Return a factory for SensorReadings with valid defaults for every field."""
+
+    def factory(
+        ts: datetime = datetime(2024, 1, 15, 12, 0, 0),
+        sensor_id: str = "TI-A1B2-C3D4",
+        temperature: float = 25.0,
+        pressure: float = 500.0,
+        humidity: float = 50.0,
+    ) -> SensorReading:
+        return SensorReading(
+            timestamp=ts,
+            sensor_id=sensor_id,
+            temperature=temperature,
+            pressure=pressure,
+            humidity=humidity,
+        )
+
+    return factory
@@ -1,6 +1,7 @@
 """Tests for sensor_toolkit.analyzers module."""
 
 import math
+import random
 from datetime import datetime
 
 import pytest
@@ -9,10 +10,13 @@ from sensor_toolkit.analyzers import (
     Anomaly,
     FieldStats,
     StatsResult,
+    StreamingStats,
     _compute_stats,
+    _P2Median,
     calculate_statistics,
     detect_anomalies,
     generate_report,
+    stream_statistics,
 )
 from sensor_toolkit.validators import SensorReading
 
@@ -83,6 +87,14 @@ class TestComputeStats:
         assert result.mean == 5.0
         assert result.std == 2.0
 
+    def test_large_offset_std_stable(self) -> None:
+        # Same spread as [4, 7, 13, 16] (std≈4.743); a naive sum-of-squares
+        # formula loses every significant digit at this offset.
+        values = [1e9 + 4.0, 1e9 + 7.0, 1e9 + 13.0, 1e9 + 16.0]
+        result = _compute_stats(values)
+        assert result.mean == 1e9 + 10.0
+        assert result.std == pytest.approx(math.sqrt(22.5))
+
     def test_identical_values(self) -> None:
         result = _compute_stats([7.0, 7.0, 7.0])
         assert result.mean == 7.0
@@ -155,6 +167,85 @@ class TestCalculateStatistics:
         assert result["TI-X1Y2-Z3W4"].sensor_id == "TI-X1Y2-Z3W4"
 
 
+# ---------------------------------------------------------------------------
+# StreamingStats / stream_statistics
+# ---------------------------------------------------------------------------
+
+class TestP2Median:
+    """Tests for the _P2Median estimator."""
+
+    def test_empty_is_nan(self) -> None:
+        assert math.isnan(_P2Median().value())
+
+    @pytest.mark.parametrize(
+        ("values", "expected"),
+        [([3.0], 3.0), ([3.0, 1.0], 2.0), ([5.0, 1.0, 3.0, 2.0, 4.0], 3.0)],
+    )
+    def test_exact_for_few_values(self, values: list[float], expected: float) -> None:
+        estimator = _P2Median()
+        for v in values:
+            estimator.add(v)
+        assert estimator.value() == expected
+
+    def test_estimate_close_to_true_median(self) -> None:
+        values = [float(i) for i in range(1001)]
+        random.Random(42).shuffle(values)
+        estimator = _P2Median()
+        for v in values:
+            estimator.add(v)
+        assert estimator.value() == pytest.approx(500.0, abs=10.0)
+
+
+class TestStreamingStats:
+    """Tests for StreamingStats and stream_statistics."""
+
+    def test_matches_calculate_statistics(self) -> None:
+        rng = random.Random(7)
+        readings = [
+            _reading(
+                sensor_id=rng.choice(["TI-A1B2-C3D4", "TI-X1Y2-Z3W4"]),
+                temperature=rng.gauss(25.0, 3.0),
+                pressure=rng.gauss(500.0, 20.0),
+                humidity=rng.uniform(30.0, 60.0),
+            )
+            for _ in range(200)
+        ]
+        expected = calculate_statistics(readings)
+        result = stream_statistics(iter(readings))
+        assert result.keys() == expected.keys()
+        for sid, stats in result.items():
+            assert stats.reading_count == expected[sid].reading_count
+            for field in ("temperature", "pressure", "humidity"):
+                got, want = getattr(stats, field), getattr(expected[sid], field)
+                assert got.mean == pytest.approx(want.mean)
+                assert got.std == pytest.approx(want.std)
+                assert got.min == want.min
+                assert got.max == want.max
+
+    def test_exact_mode_matches_calculate_statistics(self) -> None:
+        readings = [_reading(temperature=float(t)) for t in (5, 1, 4, 2, 3, 9)]
+        result = stream_statistics(readings, approximate=False)
+        assert result == calculate_statistics(readings)
+
+    def test_nan_values_skipped(self) -> None:
+        acc = StreamingStats("TI-A1B2-C3D4")
+        acc.update(10.0, 500.0, 50.0)
+        acc.update(float("nan"), float("nan"), float("nan"))
+        stats = acc.finalize()
+        assert stats.reading_count == 1
+        assert stats.temperature.mean == 10.0
+        assert stats.temperature.std == 0.0
+
+    def test_empty_accumulator_returns_nan(self) -> None:
+        stats = StreamingStats("TI-A1B2-C3D4").finalize()
+        assert stats.reading_count == 0
+        assert math.isnan(stats.temperature.mean)
+        assert math.isnan(stats.humidity.median)
+
+    def test_empty_stream(self) -> None:
+        assert stream_statistics([]) == {}
+
+
 # ---------------------------------------------------------------------------
 # detect_anomalies
 # ---------------------------------------------------------------------------
@@ -245,6 +336,63 @@ class TestDetectAnomalies:
         sensor_ids = {a.reading.sensor_id for a in anomalies}
         assert "TI-AAAA-AAAA" not in sensor_ids
 
+    def test_anomalies_in_reading_then_field_order(self) -> None:
+        readings = [_reading(sensor_id="TI-BBBB-BBBB", temperature=20.0) for _ in range(9)]
+        readings += [_reading(temperature=20.0, humidity=50.0) for _ in range(9)]
+        readings.append(_reading(sensor_id="TI-BBBB-BBBB", temperature=100.0))
+        readings.append(_reading(temperature=100.0, humidity=99.0))
+        anomalies = detect_anomalies(readings, z_threshold=2.0)
+        assert [(a.reading, a.field) for a in anomalies] == [
+            (readings[18], "temperature"),
+            (readings[19], "temperature"),
+            (readings[19], "humidity"),
+        ]
+
+    def test_precomputed_stats_reused(self) -> None:
+        readings = [_reading(temperature=20.0) for _ in range(9)]
+        readings.append(_reading(temperature=100.0))
+        stats = calculate_statistics(readings)
+        assert detect_anomalies(readings, stats=stats) == detect_anomalies(readings)
+
+    def test_precomputed_stats_used_as_given(self) -> None:
+        # Stats from a different batch decide the z-scores, proving no recompute
+        readings = [_reading(temperature=30.0)]
+        stats = calculate_statistics([_reading(temperature=t) for t in (10.0, 20.0)])
+        anomalies = detect_anomalies(readings, z_threshold=2.0, stats=stats)
+        assert len(anomalies) == 1
+        assert anomalies[0].z_score == pytest.approx(3.0)
+
+    def test_each_sensor_uses_own_stats(self) -> None:
+        # Sensor B has no entry in stats, so only sensor A's row is scored
+        readings = [
+            _reading(temperature=30.0),
+            _reading(sensor_id="TI-X1Y2-Z3W4", temperature=99.0),
+        ]
+        stats = calculate_statistics([_reading(temperature=t) for t in (10.0, 20.0)])
+        anomalies = detect_anomalies(readings, z_threshold=2.0, stats=stats)
+        assert [a.reading.sensor_id for a in anomalies] == ["TI-A1B2-C3D4"]
+
+    def test_value_on_threshold_not_flagged(self) -> None:
+        # mean 15, std 5: the value 20 sits exactly at z = 1.0
+        readings = [_reading(temperature=t) for t in (10.0, 20.0)]
+        assert detect_anomalies(readings, z_threshold=1.0) == []
+        assert len(detect_anomalies(readings, z_threshold=0.99)) == 2
+
+    def test_threshold_decided_by_exact_z_score(self) -> None:
+        # z for 0.2 rounds to exactly 1.0, yet 0.2 < mean - std in floating
+        # point, so a bounds-only test would flag it
+        readings = [_reading(temperature=t) for t in (67.0, 0.2)]
+        anomalies = detect_anomalies(readings, z_threshold=1.0)
+        assert all(a.z_score > 1.0 for a in anomalies)
+        assert anomalies == []
+
+    def test_value_is_the_readings_own_object(self) -> None:
+        readings = [_reading(temperature=10) for _ in range(9)] + [_reading(temperature=0)]
+        anomalies = detect_anomalies(readings, z_threshold=2.0)
+        assert len(anomalies) == 1
+        assert anomalies[0].value == 0
+        assert type(anomalies[0].value) is int
+
 
 # ---------------------------------------------------------------------------
 # generate_report
@@ -6,10 +6,12 @@ from datetime import datetime, timedelta
 import pytest
 
 from sensor_toolkit.cleaners import (
+    clamp_frame,
     clamp_outliers,
     fill_missing_timestamps,
     remove_duplicates,
 )
+from sensor_toolkit.frame import SensorFrame
 from sensor_toolkit.validators import SensorReading
 
 
@@ -196,6 +198,50 @@ class TestClampOutliers:
         assert result[1].temperature == 25.0
         assert result[2].temperature == 150.0
 
+    def test_nan_placeholders_preserved(self) -> None:
+        nan = float("nan")
+        result = clamp_outliers([_reading(temperature=nan, pressure=nan, humidity=nan)])
+        assert math.isnan(result[0].temperature)
+        assert math.isnan(result[0].pressure)
+        assert math.isnan(result[0].humidity)
+
+
+# ---------------------------------------------------------------------------
+# clamp_frame
+# ---------------------------------------------------------------------------
+
+class TestClampFrame:
+    """Tests for the clamp_frame function."""
+
+    def test_empty_frame(self) -> None:
+        assert len(clamp_frame(SensorFrame())) == 0
+
+    def test_matches_clamp_outliers(self) -> None:
+        readings = [
+            _reading(temperature=-100.0, pressure=2000.0, humidity=50.0),
+            _reading(temperature=25.0, pressure=-5.0, humidity=150.0),
+            _reading(sensor_id="TI-X1Y2-Z3W4", temperature=200.0),
+        ]
+        result = clamp_frame(SensorFrame.from_readings(readings))
+        assert result.to_readings() == clamp_outliers(readings)
+
+    def test_custom_ranges(self) -> None:
+        frame = SensorFrame.from_readings([_reading(temperature=50.0, humidity=5.0)])
+        result = clamp_frame(frame, temp_range=(0.0, 40.0), humidity_range=(10.0, 70.0))
+        assert result.temperature[0] == 40.0
+        assert result.humidity[0] == 10.0
+
+    def test_nan_preserved(self) -> None:
+        frame = SensorFrame.from_readings([_reading(pressure=float("nan"))])
+        assert math.isnan(clamp_frame(frame).pressure[0])
+
+    def test_input_frame_not_modified(self) -> None:
+        frame = SensorFrame.from_readings([_reading(temperature=200.0)])
+        result = clamp_frame(frame)
+        result.timestamps.clear()
+        assert frame.temperature[0] == 200.0
+        assert len(frame.timestamps) == 1
+
 
 # ---------------------------------------------------------------------------
 # fill_missing_timestamps
@@ -233,6 +279,17 @@ class TestFillMissingTimestamps:
         result = fill_missing_timestamps(readings, interval_seconds=60)
         assert len(result) == 6  # original 2 + 4 placeholders
 
+    def test_partial_interval_gap(self) -> None:
+        ts1 = datetime(2024, 1, 1, 12, 0, 0)
+        ts2 = datetime(2024, 1, 1, 12, 2, 30)  # 2.5 min gap
+        readings = [_reading(ts=ts1), _reading(ts=ts2)]
+        result = fill_missing_timestamps(readings, interval_seconds=60)
+        assert [r.timestamp for r in result[1:3]] == [
+            datetime(2024, 1, 1, 12, 1, 0),
+            datetime(2024, 1, 1, 12, 2, 0),
+        ]
+        assert len(result) == 4
+
     def test_placeholder_has_nan_values(self) -> None:
         ts1 = datetime(2024, 1, 1, 12, 0, 0)
         ts2 = datetime(2024, 1, 1, 12, 2, 0)
@@ -0,0 +1,66 @@
+"""Tests for sensor_toolkit.frame module."""
+
+import math
+from collections.abc import Callable
+from datetime import datetime
+
+from sensor_toolkit.frame import SensorFrame
+from sensor_toolkit.validators import SensorReading
+
+ReadingFactory = Callable[..., SensorReading]
+
+# ---------------------------------------------------------------------------
+# SensorFrame
+# ---------------------------------------------------------------------------
+
+
+class TestSensorFrame:
+    """Tests for the SensorFrame container."""
+
+    def test_empty_frame(self) -> None:
+        frame = SensorFrame()
+        assert len(frame) == 0
+        assert frame.to_readings() == []
+
+    def test_from_empty_readings(self) -> None:
+        frame = SensorFrame.from_readings([])
+        assert len(frame) == 0
+        assert frame.sensor_names == []
+
+    def test_columns_follow_row_order(self, make_reading: ReadingFactory) -> None:
+        ts1 = datetime(2024, 1, 1, 12, 0, 0)
+        ts2 = datetime(2024, 1, 1, 12, 1, 0)
+        readings = [
+            make_reading(ts=ts1, temperature=10.0, pressure=400.0, humidity=30.0),
+            make_reading(ts=ts2, sensor_id="TI-X1Y2-Z3W4", temperature=20.0),
+        ]
+        frame = SensorFrame.from_readings(readings)
+        assert len(frame) == 2
+        assert frame.timestamps == [ts1, ts2]
+        assert frame.sensor_ids == ["TI-A1B2-C3D4", "TI-X1Y2-Z3W4"]
+        assert list(frame.temperature) == [10.0, 20.0]
+        assert list(frame.pressure) == [400.0, 500.0]
+        assert list(frame.humidity) == [30.0, 50.0]
+
+    def test_round_trip(self, make_reading: ReadingFactory) -> None:
+        readings = [
+            make_reading(temperature=10.0),
+            make_reading(ts=datetime(2024, 1, 1, 13, 0, 0), sensor_id="TI-X1Y2-Z3W4"),
+        ]
+        assert SensorFrame.from_readings(readings).to_readings() == readings
+
+    def test_nan_preserved(self, make_reading: ReadingFactory) -> None:
+        frame = SensorFrame.from_readings([make_reading(temperature=float("nan"))])
+        assert math.isnan(frame.temperature[0])
+        assert math.isnan(frame.to_readings()[0].temperature)
+
+    def test_sensor_ids_encoded_as_codes(self, make_reading: ReadingFactory) -> None:
+        readings = [
+            make_reading(sensor_id="TI-X1Y2-Z3W4"),
+            make_reading(sensor_id="TI-A1B2-C3D4"),
+            make_reading(sensor_id="TI-X1Y2-Z3W4"),
+        ]
+        frame = SensorFrame.from_readings(readings)
+        assert frame.sensor_names == ["TI-X1Y2-Z3W4", "TI-A1B2-C3D4"]
+        assert list(frame.sensor_codes) == [0, 1, 0]
+        assert frame.sensor_ids == ["TI-X1Y2-Z3W4", "TI-A1B2-C3D4", "TI-X1Y2-Z3W4"]
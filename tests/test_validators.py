@@ -6,6 +6,7 @@ from pathlib import Path
 import pytest
 
 from sensor_toolkit.validators import (
+    SENSOR_ID_PATTERN,
     SensorReading,
     validate_batch,
     validate_csv_file,
@@ -67,6 +68,7 @@ class TestSensorIdValidation:
             "TI-abcd-1234",
             "",
             "TI-AB!@-1234",
+            "TI-ABCD-1234\n",
         ],
     )
     def test_invalid_sensor_ids(self, sample_timestamp: datetime, sensor_id: str):
@@ -75,6 +77,11 @@ class TestSensorIdValidation:
         errors = validate_reading(reading)
         assert any("sensor_id" in e for e in errors)
 
+    def test_public_pattern_rejects_trailing_newline(self):
+        """SENSOR_ID_PATTERN.match must not accept a trailing newline."""
+        assert SENSOR_ID_PATTERN.match("TI-ABCD-1234")
+        assert SENSOR_ID_PATTERN.match("TI-ABCD-1234\n") is None
+
 
 class TestTemperatureValidation:
     """Tests for temperature range validation."""
@@ -330,6 +337,63 @@ class TestValidateBatch:
         assert result["valid"] == 0
         assert result["invalid"] == 1
 
+    def test_nan_reading_invalid(self, sample_timestamp: datetime):
+        """NaN measurements should be rejected by the batch fast path."""
+        reading = SensorReading(sample_timestamp, "TI-A1B2-C3D4", float("nan"), 500.0, 50.0)
+        result = validate_batch([reading])
+        assert result["invalid"] == 1
+        assert result["errors"][0]["messages"] == validate_reading(reading)
+
+    def test_batch_messages_match_validate_reading(self, sample_timestamp: datetime):
+        """Batch error messages should be exactly those of validate_reading."""
+        readings = [
+            SensorReading(sample_timestamp, "TI-A1B2-C3D4", 25.0, 500.0, 50.0),
+            SensorReading(sample_timestamp, "INVALID", 200.0, -1.0, 101.0),
+            SensorReading(sample_timestamp, "TI-X1Y2-Z3W4", 25.0, 1000.1, 50.0),
+        ]
+        result = validate_batch(readings)
+        for error in result["errors"]:
+            assert error["messages"] == validate_reading(readings[error["index"]])
+
+    def test_max_errors_stops_early(self, sample_timestamp: datetime):
+        """Validation should stop once max_errors invalid readings are found."""
+        readings = [
+            SensorReading(sample_timestamp, "INVALID", 25.0, 500.0, 50.0),
+            SensorReading(sample_timestamp, "TI-A1B2-C3D4", 25.0, 500.0, 50.0),
+            SensorReading(sample_timestamp, "TI-A1B2-C3D4", 200.0, 500.0, 50.0),
+            SensorReading(sample_timestamp, "INVALID", 25.0, 500.0, 50.0),
+        ]
+        result = validate_batch(readings, max_errors=2)
+        assert result["truncated"] is True
+        assert result["total"] == 3
+        assert result["valid"] == 1
+        assert [e["index"] for e in result["errors"]] == [0, 2]
+
+    def test_max_errors_not_truncated_at_end(self, sample_timestamp: datetime):
+        """Reaching max_errors on the last reading is not a truncation."""
+        readings = [
+            SensorReading(sample_timestamp, "INVALID1", 25.0, 500.0, 50.0),
+            SensorReading(sample_timestamp, "INVALID2", 25.0, 500.0, 50.0),
+        ]
+        assert validate_batch(readings)["truncated"] is False
+        result = validate_batch(readings, max_errors=2)
+        assert result["truncated"] is False
+        assert result["total"] == 2
+
+    def test_max_errors_zero_validates_nothing(self, sample_timestamp: datetime):
+        """max_errors=0 stops before the first reading."""
+        readings = [SensorReading(sample_timestamp, "TI-A1B2-C3D4", 25.0, 500.0, 50.0)]
+        result = validate_batch(readings, max_errors=0)
+        assert result["truncated"] is True
+        assert result["total"] == 0
+        assert validate_batch([], max_errors=0)["truncated"] is False
+
+    def test_negative_max_errors_rejected(self, sample_timestamp: datetime):
+        """A negative cap is a caller error, not 'no cap'."""
+        readings = [SensorReading(sample_timestamp, "INVALID", 25.0, 500.0, 50.0)]
+        with pytest.raises(ValueError, match="max_errors"):
+            validate_batch(readings, max_errors=-1)
+
 
 class TestValidateRows:
     """Tests for validate_rows function (no file I/O)."""
@@ -404,11 +468,39 @@ class TestValidateRows:
         indices = [e["index"] for e in result["errors"]]
         assert indices == sorted(indices)
 
+    def test_error_indices_refer_to_rows(self) -> None:
+        rows = [
+            self._make_row(temperature="bad"),  # parse error at 0
+            self._make_row(),                   # valid at 1
+            self._make_row(sensor_id="BAD"),    # validation error at 2
+        ]
+        result = validate_rows(rows)
+        assert [e["index"] for e in result["errors"]] == [0, 2]
+
+    def test_accepts_iterator(self) -> None:
+        rows = (self._make_row(humidity=h) for h in ("50.0", "150.0", "60.0"))
+        result = validate_rows(rows)
+        assert result["total"] == 3
+        assert result["valid"] == 2
+        assert [e["index"] for e in result["errors"]] == [1]
+
     def test_range_validation_through_rows(self) -> None:
         result = validate_rows([self._make_row(humidity="150.0")])
         assert result["invalid"] == 1
         assert any("Humidity" in m for m in result["errors"][0]["messages"])
 
+    def test_max_errors(self) -> None:
+        rows = [self._make_row(temperature="bad"), self._make_row(sensor_id="BAD")]
+        rows += [self._make_row()] * 3
+        result = validate_rows(iter(rows), max_errors=1)
+        assert result["truncated"] is True
+        assert result["total"] == 1
+        assert [e["index"] for e in result["errors"]] == [0]
+
+    def test_negative_max_errors_rejected(self) -> None:
+        with pytest.raises(ValueError, match="max_errors"):
+            validate_rows([self._make_row()], max_errors=-1)
+
 
 class TestValidateCsvFile:
     """Tests for validate_csv_file (thin I/O wrapper)."""
@@ -458,6 +550,67 @@ class TestValidateCsvFile:
         result = validate_csv_file(csv_file)
         assert result["total"] == 0
 
+    def test_reordered_columns(self, tmp_path: Path) -> None:
+        csv_file = tmp_path / "reordered.csv"
+        csv_file.write_text(
+            "sensor_id,timestamp,humidity,pressure,temperature\n"
+            "TI-A1B2-C3D4,2024-01-15T10:30:00,50.0,500.0,25.0\n"
+            "TI-A1B2-C3D4,2024-01-15T10:31:00,150.0,500.0,25.0\n"
+        )
+        result = validate_csv_file(csv_file)
+        assert result["total"] == 2
+        assert result["valid"] == 1
+        assert any("Humidity" in m for m in result["errors"][0]["messages"])
+
+    def test_short_row_reported(self, tmp_path: Path) -> None:
+        csv_file = tmp_path / "short.csv"
+        csv_file.write_text(
+            "timestamp,sensor_id,temperature,pressure,humidity\n"
+            "2024-01-15T10:30:00,TI-A1B2-C3D4\n"
+        )
+        result = validate_csv_file(csv_file)
+        assert result["invalid"] == 1
+        assert result["errors"][0]["messages"] == ["Row 0: 'temperature'"]
+
+    def test_short_row_message_matches_dict_path(self, tmp_path: Path) -> None:
+        csv_file = tmp_path / "short.csv"
+        csv_file.write_text(
+            "timestamp,sensor_id,temperature,pressure,humidity\n"
+            "2024-01-15T10:30:00,TI-A1B2-C3D4,25.0,500.0\n"
+        )
+        row = {
+            "timestamp": "2024-01-15T10:30:00",
+            "sensor_id": "TI-A1B2-C3D4",
+            "temperature": "25.0",
+            "pressure": "500.0",
+        }
+        file_result = validate_csv_file(csv_file)
+        assert file_result["errors"] == validate_rows([row])["errors"]
+
+    def test_extra_trailing_fields_ignored(self, tmp_path: Path) -> None:
+        csv_file = tmp_path / "extra.csv"
+        csv_file.write_text(
+            "timestamp,sensor_id,temperature,pressure,humidity\n"
+            "2024-01-15T10:30:00,TI-A1B2-C3D4,25.0,500.0,50.0,\n"
+            "2024-01-15T10:31:00,TI-A1B2-C3D4,25.0,500.0,50.0,extra,more\n"
+        )
+        result = validate_csv_file(csv_file)
+        assert result["total"] == 2
+        assert result["valid"] == 2
+
+    def test_blank_lines_skipped(self, tmp_path: Path) -> None:
+        csv_file = tmp_path / "blank.csv"
+        csv_file.write_text(
+            "timestamp,sensor_id,temperature,pressure,humidity\n"
+            "\n"
+            "2024-01-15T10:30:00,TI-A1B2-C3D4,25.0,500.0,50.0\n"
+            "\n"
+            "2024-01-15T10:31:00,INVALID,25.0,500.0,50.0\n"
+        )
+        result = validate_csv_file(csv_file)
+        assert result["total"] == 2
+        assert [e["index"] for e in result["errors"]] == [1]
+
     def test_matches_validate_rows_output(self, tmp_path: Path) -> None:
         row_data = {
             "timestamp": "2024-01-15T10:30:00",
@@ -472,3 +625,23 @@ class TestValidateCsvFile:
         assert file_result["total"] == rows_result["total"]
         assert file_result["valid"] == rows_result["valid"]
         assert file_result["invalid"] == rows_result["invalid"]
+
+    def test_max_errors(self, tmp_path: Path) -> None:
+        rows = [
+            {
+                "timestamp": "2024-01-15T10:30:00",
+                "sensor_id": sensor_id,
+                "temperature": "25.0",
+                "pressure": "500.0",
+                "humidity": "50.0",
+            }
+            for sensor_id in ("TI-A1B2-C3D4", "BAD1", "BAD2", "BAD3")
+        ]
+        result = validate_csv_file(self._write_csv(tmp_path, rows), max_errors=2)
+        assert result["truncated"] is True
+        assert result["total"] == 3
+        assert [e["index"] for e in result["errors"]] == [1, 2]
+
+    def test_negative_max_errors_rejected(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="max_errors"):
+            validate_csv_file(tmp_path / "missing.csv", max_errors=-1)